@@ -25,21 +25,20 @@ import sys
 import asyncio
 import os
 import ctypes
+import hashlib
 import tempfile
+import threading
+import concurrent.futures
+import importlib.util
 import msvcrt   # Windows built-in — no install needed
+from functools import lru_cache
 
 # ── Dependency check ──────────────────────────────────────────────────────────
-try:
-    import edge_tts
-    EDGE_AVAILABLE = True
-except ImportError:
-    EDGE_AVAILABLE = False
-
-try:
-    import pyttsx3
-    PYTTSX_AVAILABLE = True
-except ImportError:
-    PYTTSX_AVAILABLE = False
+# Only probe for the engines here; each one is imported the first time it is
+# actually used, so picking the offline voice never loads edge-tts (and vice
+# versa).
+EDGE_AVAILABLE   = importlib.util.find_spec("edge_tts") is not None
+PYTTSX_AVAILABLE = importlib.util.find_spec("pyttsx3") is not None
 
 if not EDGE_AVAILABLE and not PYTTSX_AVAILABLE:
     print("\n  ERROR: No TTS engine found.")
@@ -97,55 +96,166 @@ _ONES = [
 ]
 _TENS = ["","","twenty","thirty","forty","fifty","sixty","seventy","eighty","ninety"]
 
-def _number_to_words(n: int) -> str:
+def _compute_words(n: int) -> str:
     if n < 20:
         return _ONES[n]
     if n < 100:
         t, o = divmod(n, 10)
         return (_TENS[t] + (" " + _ONES[o] if o else "")).strip()
-    if n < 1000:
-        h, r = divmod(n, 100)
-        rest = (" and " + _number_to_words(r)) if r else ""
-        return _ONES[h] + " hundred" + rest
-    return str(n)
+    h, r = divmod(n, 100)
+    rest = (" and " + _compute_words(r)) if r else ""
+    return _ONES[h] + " hundred" + rest
+
+# Every number get_int can produce (1–999) is spelled out once, at import.
+_WORDS = tuple(_compute_words(n) for n in range(1000))
+
+def _number_to_words(n: int) -> str:
+    return _WORDS[n] if 0 <= n < 1000 else str(n)
 
+@lru_cache(maxsize=1024)
 def get_phrase(n: int) -> str:
     return str(PHRASES[n]) if n in PHRASES else str(_number_to_words(n))
 
 
 # ── Windows MCI audio player ──────────────────────────────────────────────────
-def _play_mp3_windows(path: str):
-    mci   = ctypes.windll.winmm.mciSendStringW
-    alias = "bingo_tts"
-    mci(f'open "{path}" type mpegvideo alias {alias}', None, 0, None)
-    mci(f'play {alias} wait', None, 0, None)
-    mci(f'close {alias}', None, 0, None)
-
-
-# ── edge-tts engine ───────────────────────────────────────────────────────────
-async def _speak_edge_async(text: str, voice: str, rate: str, volume: str):
-    communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume)
-    fd, tmp = tempfile.mkstemp(suffix=".mp3")
-    os.close(fd)
+_MCI_ALIAS = "bingo_tts"
+_mci       = ctypes.windll.winmm.mciSendStringW     # resolved once, not per call
+
+def _mci_open(path: str):
+    """Open (and decode the header of) `path` so a later _mci_play starts at once."""
+    _mci(f'open "{path}" type mpegvideo alias {_MCI_ALIAS}', None, 0, None)
+
+def _mci_play():
+    """Play the currently opened file to the end, then close it."""
+    _mci(f'play {_MCI_ALIAS} wait', None, 0, None)    # blocks in winmm, no polling
+    _mci(f'close {_MCI_ALIAS}', None, 0, None)
+
+
+# ── edge-tts engine (phrase cache) ────────────────────────────────────────────
+CACHE_DIR       = os.path.join(tempfile.gettempdir(), "bingo_tts_cache")
+CACHE_MAX_FILES = 3000   # finished mp3s kept; least recently used go first
+PARTIAL_PREFIX  = "partial_"
+PARTIAL_MAX_AGE = 3600   # seconds; older partial files are left-overs
+RENDER_LIMIT    = 8      # max simultaneous edge-tts requests
+
+_edge_tts     = None   # edge_tts module, see _load_edge_tts()
+_LOOP         = None   # background event loop, see _edge_loop()
+_render_slots = None
+_cache_ready  = False
+
+def _load_edge_tts():
+    global _edge_tts
+    if _edge_tts is None:
+        import edge_tts
+        _edge_tts = edge_tts
+    return _edge_tts
+
+def _edge_loop() -> asyncio.AbstractEventLoop:
+    """
+    One event loop, kept alive in a background thread for the whole game, so
+    synthesis of upcoming phrases overlaps playback of the current one.
+    """
+    global _LOOP
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        threading.Thread(target=_LOOP.run_forever, name="edge-tts", daemon=True).start()
+    return _LOOP
+
+def _pct(value: int) -> str:
+    return f"+{value}%" if value >= 0 else f"{value}%"
+
+def _prepare_cache_dir():
+    """
+    Create CACHE_DIR once per run and tidy it: remove partial files left by
+    a game stopped mid-synthesis, and trim finished mp3s to CACHE_MAX_FILES.
+    """
+    global _cache_ready
+    if _cache_ready:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    now, done = time.time(), []
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            try:
+                mtime = entry.stat().st_mtime
+                if entry.name.startswith(PARTIAL_PREFIX):
+                    # a young one may still be written by another running game
+                    if now - mtime > PARTIAL_MAX_AGE:
+                        os.remove(entry.path)
+                elif entry.name.endswith(".mp3"):
+                    done.append((mtime, entry.path))
+            except OSError:
+                pass
+    done.sort()
+    for _, path in done[:max(0, len(done) - CACHE_MAX_FILES)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    _cache_ready = True
+
+def _cache_path(text: str, voice: str, rate: str, volume: str) -> str:
+    key = hashlib.sha1(f"{voice}|{rate}|{volume}|{text}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, key + ".mp3")
+
+async def _render_edge_async(text: str, voice: str, rate: str, volume: str) -> str:
+    """Synthesise `text` into the cache (if not already there) and return its path."""
+    path = _cache_path(text, voice, rate, volume)
+    try:
+        os.utime(path)          # cache hit: mark as recently used
+        return path
+    except OSError:
+        pass
+    communicate = _load_edge_tts().Communicate(text, voice, rate=rate, volume=volume)
+    fd, tmp = tempfile.mkstemp(prefix=PARTIAL_PREFIX, suffix=".part", dir=CACHE_DIR)
     try:
-        await communicate.save(tmp)
-        _play_mp3_windows(tmp)
+        with os.fdopen(fd, "wb") as f:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+        os.replace(tmp, path)     # atomic — never leaves a half-written cache entry
     finally:
         try:
             os.remove(tmp)
         except OSError:
             pass
+    return path
+
+async def _prefetch_async(text: str, voice: str, rate: str, volume: str) -> str:
+    global _render_slots
+    if _render_slots is None:       # created on the loop it is used from
+        _render_slots = asyncio.Semaphore(RENDER_LIMIT)
+    async with _render_slots:
+        return await _render_edge_async(text, voice, rate, volume)
+
+def prefetch_mp3(text: str, voice: str, rate: str, volume: str) -> concurrent.futures.Future:
+    """Schedule `text` for synthesis on the background loop; the Future yields the mp3 path."""
+    _prepare_cache_dir()
+    _load_edge_tts()      # import here, not on the loop thread
+    return asyncio.run_coroutine_threadsafe(
+        _prefetch_async(str(text), voice, rate, volume), _edge_loop())
+
+def precache_phrases(numbers: list, voice: str, rate_str: str, volume_str: str) -> dict:
+    """
+    Queue the phrase for every number for synthesis into CACHE_DIR and
+    return {number: Future of mp3 path} straight away. Numbers are queued in
+    call order, so the next call is always rendered while the current one
+    plays. Phrases already cached from an earlier game (same voice / rate /
+    volume) are not re-synthesised.
+    """
+    return {n: prefetch_mp3(get_phrase(n), voice, rate_str, volume_str) for n in numbers}
 
-def speak_edge(text: str, voice: str, rate_pct: int, volume_pct: int):
-    text       = str(text)
-    rate_str   = f"+{rate_pct}%" if rate_pct >= 0 else f"{rate_pct}%"
-    volume_str = f"+{volume_pct}%" if volume_pct >= 0 else f"{volume_pct}%"
-    asyncio.run(_speak_edge_async(text, voice, rate_str, volume_str))
+def wait_for_mp3(future: concurrent.futures.Future) -> str:
+    """Future.result() that stays responsive to CTRL+C on Windows."""
+    while True:
+        try:
+            return future.result(timeout=0.25)
+        except concurrent.futures.TimeoutError:
+            pass
 
 
 # ── pyttsx3 engine ────────────────────────────────────────────────────────────
-def speak_pyttsx(text: str, engine, rate: int):
-    engine.setProperty("rate", rate)
+def speak_pyttsx(text: str, engine):
     engine.say(str(text))
     engine.runAndWait()
 
@@ -174,20 +284,25 @@ def countdown_with_pause(pace: int):
     """
     Count down `pace` seconds between numbers.
     SPACE or P pauses; any key resumes.
+    Timed against a monotonic deadline, so printing never makes it drift.
     """
     flush_keys()
-    remaining = pace
-    while remaining > 0:
+    deadline = time.monotonic() + pace
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
         print(
-            f"  \u23F3  Next number in {remaining:>2}s  \u2014  [SPACE] to pause ...   ",
+            f"  \u23F3  Next number in {remaining:4.1f}s  \u2014  [SPACE] to pause ...   ",
             end="\r", flush=True
         )
-        time.sleep(1)
-        remaining -= 1
+        time.sleep(min(0.5, remaining))
         if msvcrt.kbhit():
             key = msvcrt.getch()
             if key in (b" ", b"p", b"P"):
+                paused_at = time.monotonic()
                 wait_for_resume()
+                deadline += time.monotonic() - paused_at
     clear_line()
 
 
@@ -245,11 +360,22 @@ def run_caller():
 
     pyttsx_engine = None
     if mode == "pyttsx":
+        import pyttsx3
         pyttsx_engine = pyttsx3.init()
+        pyttsx_engine.setProperty("rate", rate)     # constant for the whole game
 
     numbers = list(range(start, end + 1))
     random.shuffle(numbers)
     total = len(numbers)
+    phrases       = [get_phrase(n) for n in numbers]
+    display_lines = [f"  [{i:>3}/{total}]  #{n:>3}  \u2014  {p}"
+                     for i, (n, p) in enumerate(zip(numbers, phrases), 1)]
+
+    cache = {}
+    if mode == "edge":
+        # Synthesis runs in the background from here on, starting with the
+        # first numbers to be called, while the player reads the prompt.
+        cache = precache_phrases(numbers, voice_id, _pct(rate), _pct(volume))
 
     print(f"\n  Ready! Calling {total} numbers with {pace}s pace.")
     print("  SPACE = pause/resume  |  CTRL+C = stop early\n")
@@ -257,16 +383,23 @@ def run_caller():
     print()
 
     called = []
+    preopened = False     # next number's mp3 already open in MCI
     try:
         for i, n in enumerate(numbers, 1):
-            phrase = get_phrase(n)
             called.append(n)
-            print(f"  [{i:>3}/{total}]  #{n:>3}  \u2014  {phrase}")
+            print(display_lines[i - 1])
 
             if mode == "edge":
-                speak_edge(phrase, voice_id, rate, volume)
+                if not preopened:
+                    _mci_open(wait_for_mp3(cache[n]))
+                _mci_play()
+                # Open the next call now if it is ready, so the device setup
+                # happens during the countdown rather than after it.
+                preopened = i < total and cache[numbers[i]].done()
+                if preopened:
+                    _mci_open(cache[numbers[i]].result())
             else:
-                speak_pyttsx(phrase, pyttsx_engine, rate)
+                speak_pyttsx(phrases[i - 1], pyttsx_engine)
 
             # Countdown with pause support (skip after last number)
             if i < total:
@@ -276,9 +409,9 @@ def run_caller():
         print("\n\n  Stopped early.")
 
     print(f"\n  Game over! Called {len(called)}/{total} numbers.")
-    uncalled = sorted(set(numbers) - set(called))
+    uncalled = numbers[len(called):]     # numbers are called in list order
     if uncalled:
-        print(f"  Uncalled: {uncalled}")
+        print(f"  Uncalled: {sorted(uncalled)}")
     print()
 
 
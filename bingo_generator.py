@@ -13,15 +13,21 @@ Requirements:  pip install matplotlib
 """
 
 import random
+import secrets
 import math
+from typing import Optional
+import numpy as np
 import matplotlib
 matplotlib.rcParams.update({
     'figure.facecolor':  'white',
     'axes.facecolor':    'white',
     'savefig.facecolor': 'white',
 })
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.font_manager import FontProperties
 from matplotlib.backends.backend_pdf import PdfPages
 
 H_CLR    = "#1565C0"   # deep blue  (borders / text)
@@ -35,28 +41,36 @@ def grid_dims(n: int) -> tuple:
     return rows, cols
 
 
-def build_grid(numbers: list, rows: int, cols: int, free_center: bool) -> list:
-    nums = numbers[:]
-    random.shuffle(nums)
-    grid = [[""] * cols for _ in range(rows)]
-    cr, cc, idx = rows // 2, cols // 2, 0
-    for r in range(rows):
-        for c in range(cols):
-            if free_center and rows == cols and r == cr and c == cc:
-                grid[r][c] = "FREE"
-            elif idx < len(nums):
-                grid[r][c] = str(nums[idx]); idx += 1
-    return grid
+def build_grid(numbers: list, rows: int, cols: int, free_center: bool) -> np.ndarray:
+    """Lay `numbers` (already in random order) out row by row; rows x cols of str."""
+    cells = [str(n) for n in numbers]
+    if free_center and rows == cols:
+        cells.insert((rows // 2) * cols + cols // 2, "FREE")
+    cells += [""] * (rows * cols - len(cells))
+    return np.array(cells[:rows * cols], dtype=object).reshape(rows, cols)
 
 
-def draw_card_ax(ax, grid: list, rows: int, cols: int,
-                 title: str, bingo_header: bool, font_scale: float = 1.0):
+def _cells_path(xs: np.ndarray, ys: np.ndarray) -> Path:
+    """One compound Path holding a closed unit square at each (x, y)."""
+    corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]])
+    verts   = (np.column_stack([xs, ys])[:, None, :] + corners).reshape(-1, 2)
+    codes   = np.tile([Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO,
+                       Path.CLOSEPOLY], len(xs))
+    return Path(verts, codes)
+
+
+def draw_card_ax(ax, rows: int, cols: int, bingo_header: bool,
+                 font_scale: float = 1.0) -> tuple:
+    """
+    Draw the fixed part of a card — BINGO header and cell outlines — and
+    return the artists fill_card_ax() updates for each card drawn on `ax`.
+    """
     extra = 1 if bingo_header else 0
     ax.set_xlim(0, cols)
     ax.set_ylim(0, rows + extra)
     ax.set_facecolor("white")
     ax.axis("off")
-    ax.set_title(title, fontsize=13 * font_scale, fontweight="bold", color=T_CLR, pad=8)
+    title = ax.set_title("", fontsize=13 * font_scale, fontweight="bold", color=T_CLR, pad=8)
 
     # BINGO header — white fill, blue border, blue text (no ink-heavy fill)
     if bingo_header:
@@ -67,17 +81,33 @@ def draw_card_ax(ax, grid: list, rows: int, cols: int,
             ax.text(j + 0.5, rows + 0.5, lbl, ha="center", va="center",
                     fontsize=22 * font_scale, fontweight="bold", color=H_CLR)
 
-    # Number cells
-    for r in range(rows):
-        for c in range(cols):
-            val = grid[r][c]; ry = rows - 1 - r
-            fc  = FREE_CLR if val == "FREE" else "white"
-            ax.add_patch(patches.Rectangle(
-                (c, ry), 1, 1, facecolor=fc, edgecolor=H_CLR, linewidth=1.5))
-            if val:
-                fs = 10 * font_scale if val == "FREE" else 20 * font_scale
-                ax.text(c + 0.5, ry + 0.5, val, ha="center", va="center",
-                        fontsize=fs, fontweight="bold", color=T_CLR)
+    # Number cells — the FREE fill (moved onto the FREE cell, if any, per
+    # card) under one compound path of all outlines; text filled in later
+    xs, ys = np.meshgrid(np.arange(cols), np.arange(rows - 1, -1, -1))
+    xs, ys = xs.ravel(), ys.ravel()
+    free_cell = ax.add_patch(patches.Rectangle(
+        (0, 0), 1, 1, facecolor=FREE_CLR, edgecolor="none", visible=False))
+    ax.add_patch(patches.PathPatch(
+        _cells_path(xs, ys), facecolor="none", edgecolor=H_CLR, linewidth=1.5))
+    texts  = [ax.text(x + 0.5, y + 0.5, "", ha="center", va="center",
+                      fontsize=20 * font_scale, fontweight="bold", color=T_CLR)
+              for x, y in zip(xs, ys)]
+    return title, free_cell, texts, font_scale
+
+
+def fill_card_ax(card: tuple, grid: np.ndarray, title: str):
+    """Put one card's title and numbers into a layout from draw_card_ax()."""
+    title_text, free_cell, texts, font_scale = card
+    title_text.set_text(title)
+    vals = np.asarray(grid).ravel()
+    free = vals == "FREE"
+    free_cell.set_visible(free.any())
+    if free.any():
+        x, y = texts[free.argmax()].get_position()
+        free_cell.set_xy((x - 0.5, y - 0.5))
+    for text, val, is_free in zip(texts, vals, free):
+        text.set_text(val)
+        text.set_fontsize(10 * font_scale if is_free else 20 * font_scale)
 
 
 def draw_caller_ax(ax, start: int, end: int):
@@ -100,62 +130,86 @@ def draw_caller_ax(ax, start: int, end: int):
             f"Numbers {start}\u2013{end}  \u00b7  Cross off each number as you call it",
             ha="center", va="center", fontsize=9, color=T_CLR)
 
-    for idx, num in enumerate(nums):
-        r = idx // cols_cs; c = idx % cols_cs; ry = rows_cs - 1 - r
-        ax.add_patch(patches.Rectangle(
-            (c, ry), 1, 1, facecolor="white", edgecolor=H_CLR, linewidth=0.7))
-        ax.text(c + 0.5, ry + 0.5, str(num), ha="center", va="center",
-                fontsize=13, fontweight="bold", color=T_CLR)
+    rs, cs = np.divmod(np.arange(len(nums)), cols_cs)
+    rys    = rows_cs - 1 - rs
+    ax.add_patch(patches.PathPatch(
+        _cells_path(cs, rys), facecolor="none", edgecolor=H_CLR, linewidth=0.7))
+    # Build the number font once; each Text copies it (matplotlib does not
+    # keep the instance, so changing num_font later restyles nothing). A
+    # copy is cheaper than a default font built from rcParams and then
+    # given size/weight kwargs for every cell.
+    num_font = FontProperties(size=13, weight="bold")
+    for num, x, y in zip(nums, cs + 0.5, rys + 0.5):
+        ax.text(x, y, str(num), ha="center", va="center",
+                fontproperties=num_font, color=T_CLR)
+
+
+FW, FH = 8.27, 11.69   # A4 inches
+
+# Cards on the page -> (card axes rects, font scale): two cards per page,
+# or a lone card centred & enlarged
+PAGE_LAYOUTS = {
+    2: ([[0.06, 0.54, 0.88, 0.40], [0.06, 0.06, 0.88, 0.40]], 1.0),
+    1: ([[0.06, 0.25, 0.88, 0.50]],                            1.4),
+}
+
+def _card_page_template(slots: int, rows: int, cols: int, bingo_header: bool) -> tuple:
+    """
+    A4 figure with the card layout(s) already drawn: two cards with a cut
+    line, or a lone card centred & enlarged. Built once per layout; each
+    page only swaps in new numbers.
+    """
+    rects, font_scale = PAGE_LAYOUTS[slots]
+    fig = Figure(figsize=(FW, FH))
+    fig.patch.set_facecolor("white")
+    axes = [fig.add_axes(rect) for rect in rects]
+    if slots == 2:
+        fig.add_artist(Line2D(
+            [0.05, 0.95], [0.52, 0.52],
+            transform=fig.transFigure,
+            color="#aaaaaa", lw=1.5, linestyle="--"))
+        fig.text(0.5, 0.518, "\u2702  cut here  \u2702",
+                 ha="center", va="top", fontsize=8, color="#999999")
+    cards = [draw_card_ax(ax, rows, cols, bingo_header, font_scale) for ax in axes]
+    return fig, cards
 
 
 def generate_pdf(start: int, end: int, count: int,
-                 num_cards: int, free_center: bool, output_file: str):
+                 num_cards: int, free_center: bool, output_file: str,
+                 seed: Optional[int] = None):
+    """Write the cards + caller sheet; enter the printed `seed` again to regenerate them."""
     rows, cols   = grid_dims(count)
     bingo_header = (cols == 5)
-    FW, FH       = 8.27, 11.69   # A4 inches
+    seed  = secrets.randbits(64) if seed is None else seed
     pages = [list(range(num_cards))[i:i + 2] for i in range(0, num_cards, 2)]
+    templates = {slots: _card_page_template(slots, rows, cols, bingo_header)
+                 for slots in {len(page_cards) for page_cards in pages}}
 
     with PdfPages(output_file) as pdf:
         for page_cards in pages:
-            fig = plt.figure(figsize=(FW, FH))
-            fig.patch.set_facecolor("white")
-
-            if len(page_cards) == 2:
-                for slot, card_idx in enumerate(page_cards):
-                    yb = 0.54 if slot == 0 else 0.06
-                    ax = fig.add_axes([0.06, yb, 0.88, 0.40])
-                    chosen = random.sample(range(start, end + 1), count)
-                    g = build_grid(chosen, rows, cols, free_center)
-                    draw_card_ax(ax, g, rows, cols,
-                                 f"\u2726  BINGO  \u00b7  Card #{card_idx + 1}  \u2726",
-                                 bingo_header, font_scale=1.0)
-                fig.add_artist(plt.Line2D(
-                    [0.05, 0.95], [0.52, 0.52],
-                    transform=fig.transFigure,
-                    color="#aaaaaa", lw=1.5, linestyle="--"))
-                fig.text(0.5, 0.518, "\u2702  cut here  \u2702",
-                         ha="center", va="top", fontsize=8, color="#999999")
-            else:
-                ax = fig.add_axes([0.06, 0.25, 0.88, 0.50])
-                card_idx = page_cards[0]
-                chosen = random.sample(range(start, end + 1), count)
+            fig, cards = templates[len(page_cards)]
+            for card, card_idx in zip(cards, page_cards):
+                # Each card has its own RNG, seeded from the string
+                # "seed:index" (str seeds are hashed, stable across runs).
+                # Card N depends only on the seed and N, and distinct
+                # (seed, N) pairs never share a stream.
+                rng    = random.Random(f"{seed}:{card_idx}")
+                chosen = rng.sample(range(start, end + 1), count)
                 g = build_grid(chosen, rows, cols, free_center)
-                draw_card_ax(ax, g, rows, cols,
-                             f"\u2726  BINGO  \u00b7  Card #{card_idx + 1}  \u2726",
-                             bingo_header, font_scale=1.4)
-
-            pdf.savefig(fig, bbox_inches="tight", facecolor="white"); plt.close(fig)
+                fill_card_ax(card, g, f"\u2726  BINGO  \u00b7  Card #{card_idx + 1}  \u2726")
+            pdf.savefig(fig, facecolor="white")
 
         # Caller sheet
-        cf = plt.figure(figsize=(FW, FH)); cf.patch.set_facecolor("white")
+        cf = Figure(figsize=(FW, FH)); cf.patch.set_facecolor("white")
         cax = cf.add_axes([0.04, 0.04, 0.92, 0.90])
         draw_caller_ax(cax, start, end)
-        pdf.savefig(cf, bbox_inches="tight", facecolor="white"); plt.close(cf)
+        pdf.savefig(cf, facecolor="white")
 
     print(f"\n  PDF saved  \u2192  '{output_file}'")
     print(f"  Cards: {num_cards}  |  Numbers per card: {count}")
     print(f"  Grid:  {rows} rows x {cols} cols  |  BINGO header: {bingo_header}")
-    print(f"  Pages: {math.ceil(num_cards / 2)} card page(s) + 1 caller page\n")
+    print(f"  Pages: {math.ceil(num_cards / 2)} card page(s) + 1 caller page")
+    print(f"  Seed:  {seed}\n")
 
 
 def get_inputs():
@@ -200,15 +254,24 @@ def get_inputs():
         except ValueError:
             print("  \u274c  Integer only.\n")
 
+    while True:
+        sd = input("  Seed  (blank = new random cards) : ").strip()
+        if not sd:
+            seed = None; break
+        try:
+            seed = int(sd); break
+        except ValueError:
+            print("  \u274c  Integer only.\n")
+
     fname = input("  Output filename  [bingo.pdf]      : ").strip() or "bingo.pdf"
     if not fname.endswith(".pdf"):
         fname += ".pdf"
-    return start, end, count, num_cards, free_center, fname
+    return start, end, count, num_cards, free_center, seed, fname
 
 
 if __name__ == "__main__":
-    start, end, count, num_cards, free_center, fname = get_inputs()
+    start, end, count, num_cards, free_center, seed, fname = get_inputs()
     rows, cols = grid_dims(count)
     print(f"\n  Generating {num_cards} card(s)  \u00b7  {count} numbers  \u00b7  Grid {rows}\u00d7{cols} ...")
-    generate_pdf(start, end, count, num_cards, free_center, fname)
+    generate_pdf(start, end, count, num_cards, free_center, fname, seed)
     print(f"  \U0001f5a8\ufe0f   Open '{fname}' and print  \u2014  Enjoy!\n")